@@ -1,13 +1,107 @@
 """Common base class and utilities for AppDaemon apps."""
 
+import time
+from collections.abc import Callable, Mapping
+from functools import cached_property
+from types import MappingProxyType
+
 import appdaemon.plugins.hass.hassapi as hass
 
 from notify import NotificationRouter, NotifyTarget
 
+# How long a resolved set of notify services is reused for the same targets
+RESOLVE_CACHE_SECONDS = 5
+
+# House entry points (contact sensors) -> display name, shared by all apps
+ENTRY_POINTS: Mapping[str, str] = MappingProxyType({
+    "binary_sensor.front_door_state": "Front door",
+    "binary_sensor.back_gate_state": "Back gate",
+})
+
+
+class DeadlineTimer:
+    """Single-shot delay that motion events can restart or cancel cheaply.
+
+    start() and cancel() only move a monotonic deadline. At most one
+    AppDaemon timer is pending; when it fires early (the deadline moved
+    later) it re-arms for the remainder, and when cancelled it does nothing.
+    So a burst of motion on/off events doesn't become a burst of
+    run_in/cancel_timer calls.
+    """
+
+    __slots__ = ("_app", "_callback", "_deadline", "_fires_at", "_handle")
+
+    def __init__(self, app: hass.Hass, callback: Callable[[], None]):
+        self._app = app
+        self._callback = callback
+        self._deadline: float | None = None
+        # Monotonic time the pending AppDaemon timer fires at (None if none)
+        self._fires_at: float | None = None
+        self._handle = None
+
+    def start(self, seconds: float):
+        """(Re)start the delay - the callback runs `seconds` from now."""
+        self._deadline = time.monotonic() + seconds
+        if self._fires_at is not None and self._fires_at <= self._deadline:
+            # Pending timer fires first and re-arms for the rest
+            return
+        if self._handle is not None:
+            self._app.cancel_timer(self._handle, silent=True)
+        self._arm(seconds)
+
+    def cancel(self):
+        """Drop the pending callback (the AppDaemon timer is left to lapse)."""
+        self._deadline = None
+
+    def _arm(self, seconds: float):
+        """Schedule the single AppDaemon timer."""
+        self._fires_at = time.monotonic() + seconds
+        self._handle = self._app.run_in(self._on_timer, seconds)
+
+    def _on_timer(self, kwargs):
+        """AppDaemon timer fired - run the callback, or re-arm if pushed back."""
+        self._handle = None
+        self._fires_at = None
+        if self._deadline is None:
+            return
+
+        remaining = self._deadline - time.monotonic()
+        if remaining > 0:
+            self._arm(remaining)
+            return
+
+        self._deadline = None
+        self._callback()
+
+
+class StateMirror:
+    """Bool mirror of ``entity_id == true_state``, kept current by a listener.
+
+    For states that callbacks check more often than they change (e.g.
+    occupancy on every motion event or Tasmota press): the entity is read
+    once, then its own listener updates `value`, so callbacks check a local
+    bool instead of calling get_state.
+    """
+
+    __slots__ = ("_true_state", "value")
+
+    def __init__(self, app: hass.Hass, entity_id: str, true_state: str = "on"):
+        self._true_state = true_state
+        self.value: bool = app.get_state(entity_id) == true_state
+        app.listen_state(self._on_state, entity_id)
+
+    def _on_state(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        """Mirrored entity changed - update the flag."""
+        self.value = new == self._true_state
+
 
 class BaseApp(hass.Hass):
     """Base class for all apps with common utilities."""
 
+    # Minute of the last formatted time_str (instance attributes shadow these)
+    _time_str_minute: int | None = None
+    _time_str_cached: str = ""
+
     def initialize(self):
         """Override in subclass."""
         pass
@@ -31,8 +125,7 @@ class BaseApp(hass.Hass):
             title: Notification title
             data: Optional data dict (for actions, priority, etc.)
         """
-        router = NotificationRouter(self.get_state)
-        services = router.resolve_targets(targets)
+        services = self._resolve_notify_targets(targets)
 
         if not services:
             return
@@ -45,9 +138,70 @@ class BaseApp(hass.Hass):
         if data:
             service_data["data"] = data
 
-        # Call each notify service directly
+        # Dispatch all notify services without waiting on each one in turn
         for service in services:
-            self.call_service(f"notify/{service}", **service_data)
+            self.fire_service(f"notify/{service}", **service_data)
+
+    def _resolve_notify_targets(self, targets: list[NotifyTarget]) -> set[str]:
+        """Resolve targets via a shared router, reusing recent results.
+
+        Bursts of notifications to the same targets reuse one resolution for
+        RESOLVE_CACHE_SECONDS. Person presence changes clear the cache.
+        """
+        if not hasattr(self, "_router"):
+            # Created lazily since subclasses don't call super().initialize()
+            self._router = NotificationRouter(self.get_state)
+            self._resolve_cache: dict[frozenset[str], tuple[float, set[str]]] = {}
+            self.listen_state(self._on_person_change, "person")
+
+        key = frozenset(targets)
+        now = time.monotonic()
+        cached = self._resolve_cache.get(key)
+        if cached and now - cached[0] < RESOLVE_CACHE_SECONDS:
+            return cached[1]
+
+        services = self._router.resolve_targets(key)
+        self._resolve_cache[key] = (now, services)
+        return services
+
+    def _on_person_change(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        """Person presence changed - drop cached notify resolutions."""
+        self._resolve_cache.clear()
+
+    def fire_service(self, service: str, **data):
+        """Call a service without waiting for Home Assistant to respond.
+
+        Passing a callback makes AppDaemon schedule the call and return
+        immediately, so several calls go out together instead of one by one.
+        """
+        self.call_service(service, callback=self._on_fired_service_result, **data)
+
+    def _on_fired_service_result(self, result):
+        """Log failures from fire_service calls (nobody is waiting on them)."""
+        if isinstance(result, dict) and result.get("success") is False:
+            self.log("%s Service call failed: %s", self._log_prefix, result, level="WARNING")
+
+    def mirror_state(self, entity_id: str, true_state: str = "on") -> StateMirror:
+        """Mirror ``entity_id == true_state`` into a local flag (see StateMirror).
+
+        Usage::
+
+            self._occupied = self.mirror_state(self.HOUSE_OCCUPIED)
+            ...
+            if self._occupied.value:
+        """
+        return StateMirror(self, entity_id, true_state)
+
+    def time_str(self) -> str:
+        """Current time for messages (e.g. "7:05 PM"), formatted once per minute.
+
+        Bursts of alerts within the same minute reuse one strftime result.
+        """
+        minute = int(time.time()) // 60
+        if minute != self._time_str_minute:
+            self._time_str_minute = minute
+            self._time_str_cached = self.datetime().strftime("%-I:%M %p")
+        return self._time_str_cached
 
     def notify_phone(self, message: str, title: str = "Home Assistant"):
         """Send notification to Javier's phone (legacy helper)."""
@@ -71,18 +225,38 @@ class BaseApp(hass.Hass):
         self._tts_speak(self.TTS_SECOND_FLOOR, message, language)
 
     def _tts_speak(self, entity_id: str, message: str, language: str):
-        """Internal helper to call TTS service."""
-        self.call_service(
+        """Internal helper to call TTS service.
+
+        Fire-and-forget so callers (e.g. button presses) don't wait on the speaker.
+        """
+        self.fire_service(
             "tts/cloud_say",
             entity_id=entity_id,
             message=message,
             language=language,
         )
 
-    def debug(self, message: str):
-        """Log debug message with app name prefix."""
-        self.log(f"[{self.__class__.__name__}] {message}", level="DEBUG")
+    @cached_property
+    def _log_prefix(self) -> str:
+        """App name prefix for log lines, built once per app."""
+        return f"[{type(self).__name__}]"
+
+    def debug(self, message: str, *args):
+        """Log debug message with app name prefix.
+
+        Pass %-style args (``self.debug("Motion from %s", source)``) so hot
+        callbacks don't format messages that end up filtered out.
+        """
+        self._log_prefixed("DEBUG", message, args)
+
+    def info(self, message: str, *args):
+        """Log info message with app name prefix (%-style args like debug)."""
+        self._log_prefixed("INFO", message, args)
 
-    def info(self, message: str):
-        """Log info message with app name prefix."""
-        self.log(f"[{self.__class__.__name__}] {message}", level="INFO")
+    def _log_prefixed(self, level: str, message: str, args: tuple):
+        """Log with app name prefix; %-style args are only formatted if the level is enabled."""
+        if args:
+            self.log("%s " + message, self._log_prefix, *args, level=level)
+        else:
+            # No args - keep message out of the format string (it may contain %)
+            self.log("%s %s", self._log_prefix, message, level=level)
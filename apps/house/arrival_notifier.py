@@ -7,13 +7,21 @@ When Andy arrives:
 - If Javier was already home (5+ min) → notify Javier immediately
 - If Javier just arrived too → skip (arrived together)
 - If Javier not home → wait 5 min, notify Javier if he doesn't arrive
+
+The 5 min wait uses listen_state(duration=...), so AppDaemon fires it only
+if Andy is still home and drops it on its own if she leaves.
 """
 
+import datetime
+import time
+
 from common import BaseApp
 
 # Time window to consider "arrived together"
 ARRIVAL_TOGETHER_WINDOW_MINUTES = 5
 
+UTC = datetime.timezone.utc
+
 
 class ArrivalNotifier(BaseApp):
 
@@ -21,60 +29,91 @@ class ArrivalNotifier(BaseApp):
     ANDY = "person.andy"
 
     def initialize(self):
-        self.andy_arrival_timer = None
+        # Andy arrived while Javier was away and we're waiting to see if he follows
+        self._waiting_for_javier = False
+
+        # Monotonic time Javier got home, None while he's away
+        self._javier_home_since = self._initial_javier_home_since()
 
         self.listen_state(self.on_javier_arrived, self.JAVIER, new="home")
+        self.listen_state(self.on_javier_left, self.JAVIER, old="home")
         self.listen_state(self.on_andy_arrived, self.ANDY, new="home")
+        self.listen_state(self.on_andy_left, self.ANDY, old="home")
+
+        # Fires once Andy has been home for the whole "arrived together" window
+        self.listen_state(
+            self.on_andy_home_for_window,
+            self.ANDY,
+            new="home",
+            duration=ARRIVAL_TOGETHER_WINDOW_MINUTES * 60,
+        )
 
         self.info("Arrival notifier initialized")
 
     def on_javier_arrived(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        """Javier arrived - cancel Andy's pending notification if any."""
-        if old == new:
-            return
-        self._cancel_andy_arrival_timer()
+        """Javier arrived - skip Andy's pending notification if any."""
+        self._javier_home_since = time.monotonic()
+        if self._waiting_for_javier:
+            self._waiting_for_javier = False
+            self.info("Javier arrived within window - skipping Andy arrival notification")
+
+    def on_javier_left(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        """Javier left - forget when he got home."""
+        self._javier_home_since = None
+
+    def _initial_javier_home_since(self) -> float | None:
+        """Seed the arrival time from last_changed at startup (restart safety)."""
+        javier = self.get_state(self.JAVIER, attribute="all") or {}
+        if javier.get("state") != "home":
+            return None
+
+        last_changed = javier.get("last_changed")
+        if not last_changed or not isinstance(last_changed, str):
+            # Unknown arrival time - treat as home for a long time
+            return time.monotonic() - ARRIVAL_TOGETHER_WINDOW_MINUTES * 60 - 1
+
+        now = datetime.datetime.now(UTC)
+        seconds_home = (now - self.convert_utc(last_changed)).total_seconds()
+        return time.monotonic() - seconds_home
 
     def on_andy_arrived(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Andy arrived - check if we should notify."""
-        if old == new:
-            return
         self._check_andy_arrival_notification()
 
+    def on_andy_left(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        """Andy left before the window passed - AppDaemon drops the duration listener."""
+        if self._waiting_for_javier:
+            self._waiting_for_javier = False
+            self.info("Andy left before the arrival window passed")
+
     def _check_andy_arrival_notification(self):
         """Check if we should notify about Andy's arrival."""
-        # If Javier is home, check how long he's been home
-        if self.get_state(self.JAVIER) == "home":
-            last_changed = self.get_state(self.JAVIER, attribute="last_changed")
-            if last_changed and isinstance(last_changed, str):
-                import datetime
-                now = datetime.datetime.now(datetime.timezone.utc)
-                changed = self.convert_utc(last_changed)
-                minutes_home = (now - changed).total_seconds() / 60
-
-                if minutes_home > ARRIVAL_TOGETHER_WINDOW_MINUTES:
-                    # Javier was already home - notify immediately
-                    self._send_andy_arrival_notification()
-                else:
-                    # Javier just arrived too - they arrived together, skip
-                    self.info("Andy and Javier arrived together, skipping notification")
-                return
-
-        # Javier not home - wait to see if he arrives
-        self._cancel_andy_arrival_timer()
-        self.andy_arrival_timer = self.run_in(
-            self._on_andy_arrival_timer,
-            ARRIVAL_TOGETHER_WINDOW_MINUTES * 60,
-        )
+        # If Javier is home, check how long he's been home (no state read needed)
+        if self._javier_home_since is not None:
+            minutes_home = (time.monotonic() - self._javier_home_since) / 60
+
+            if minutes_home > ARRIVAL_TOGETHER_WINDOW_MINUTES:
+                # Javier was already home - notify immediately
+                self._send_andy_arrival_notification()
+            else:
+                # Javier just arrived too - they arrived together, skip
+                self.info("Andy and Javier arrived together, skipping notification")
+            return
+
+        # Javier not home - the duration listener decides once the window passes
+        self._waiting_for_javier = True
         self.info(f"Andy arrived, waiting {ARRIVAL_TOGETHER_WINDOW_MINUTES}min for Javier")
 
-    def _on_andy_arrival_timer(self, kwargs):
-        """Timer expired - Javier didn't arrive, send notification."""
-        self.andy_arrival_timer = None
+    def on_andy_home_for_window(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        """Andy has been home for the whole window - notify if Javier never showed up."""
+        if not self._waiting_for_javier:
+            return
+        self._waiting_for_javier = False
         self._send_andy_arrival_notification()
 
     def _send_andy_arrival_notification(self):
         """Send notification to Javier that Andy arrived."""
-        time_str = self.datetime().strftime("%-I:%M %p")
+        time_str = self.time_str()
         self.send_notification(
             targets=["javier"],
             message=f"{time_str} Andy is now at home",
@@ -82,10 +121,3 @@ class ArrivalNotifier(BaseApp):
             data={"tag": "house_arrived_home"},
         )
         self.info("Sent Andy arrival notification to Javier")
-
-    def _cancel_andy_arrival_timer(self):
-        """Cancel pending Andy arrival notification timer."""
-        if self.andy_arrival_timer:
-            self.cancel_timer(self.andy_arrival_timer)
-            self.andy_arrival_timer = None
-            self.info("Cancelled Andy arrival timer - Javier arrived")
@@ -11,8 +11,14 @@ Downstairs Button (ZHA):
 - Furious click: Turn off whole house + TTS announcement
 """
 
+import time
+from typing import Callable
+
 from common import BaseApp
 
+# Identical clicks within this window are treated as switch bounce
+CLICK_DEBOUNCE_SECONDS = 0.3
+
 
 class Buttons(BaseApp):
 
@@ -30,19 +36,25 @@ class Buttons(BaseApp):
     LIVING_ROOM_STANDING_FAN = "switch.tasmota"
 
     def initialize(self):
-        # Listen for ZHA button events
+        # Last downstairs click as (click_type, monotonic timestamp)
+        self._last_click: tuple[str | None, float] = (None, 0.0)
+
+        # ZHA device_id -> handler(command, args). Add new buttons here.
+        self._zha_handlers: dict[str, Callable[[str, dict], None]] = {
+            self.DOWNSTAIRS_BUTTON_DEVICE_ID: self._handle_downstairs_button,
+        }
+
+        # A single zha_event subscription no matter how many buttons there are
         self.listen_event(self.on_zha_event, event="zha_event")
 
         self.info("Buttons initialized")
 
     def on_zha_event(self, event_type: str, data: dict, **kwargs):
-        """Handle ZHA button events."""
-        device_id = data.get("device_id")
-        command = data.get("command", "")
-        args = data.get("args", {})
-
-        if device_id == self.DOWNSTAIRS_BUTTON_DEVICE_ID:
-            self._handle_downstairs_button(command, args)
+        """Dispatch ZHA events to the handler registered for the device."""
+        handler = self._zha_handlers.get(data.get("device_id", ""))
+        if handler is None:
+            return
+        handler(data.get("command", ""), data.get("args", {}))
 
     def _handle_downstairs_button(self, command: str, args: dict):
         """Handle downstairs button presses."""
@@ -51,6 +63,14 @@ class Buttons(BaseApp):
 
         click_type = args.get("click_type")
 
+        # Drop bounced duplicates of the same click
+        now = time.monotonic()
+        last_type, last_ts = self._last_click
+        self._last_click = (click_type, now)
+        if click_type == last_type and now - last_ts < CLICK_DEBOUNCE_SECONDS:
+            self.debug(f"Ignoring duplicate {click_type} click")
+            return
+
         if click_type == "single":
             self._toggle_living_room_tv_and_fan()
         elif click_type == "double":
@@ -60,8 +80,11 @@ class Buttons(BaseApp):
 
     def _toggle_living_room_tv_and_fan(self):
         """Turn on living room TV and standing fan."""
-        self.call_service("media_player/turn_on", entity_id=self.LIVING_ROOM_TV)
-        self.call_service("switch/turn_on", entity_id=self.LIVING_ROOM_STANDING_FAN)
+        # homeassistant/turn_on dispatches to each entity's own domain
+        self.call_service(
+            "homeassistant/turn_on",
+            entity_id=[self.LIVING_ROOM_TV, self.LIVING_ROOM_STANDING_FAN],
+        )
         self.info("Single click - turned on living room TV and standing fan")
 
     def _turn_off_first_floor(self):
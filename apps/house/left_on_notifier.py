@@ -32,6 +32,10 @@ class LeftOnNotifier(BaseApp):
 
     def initialize(self):
         self.vacation_check_timer = None
+        self.left_on_check_timer = None
+
+        # Friendly names rarely change - cleared when the entity registry changes
+        self._friendly_cache: dict[str, str] = {}
 
         self.listen_state(
             self.on_house_unoccupied,
@@ -47,6 +51,7 @@ class LeftOnNotifier(BaseApp):
 
         # Listen for the actionable notification response
         self.listen_event(self.on_action_triggered, event="mobile_app_notification_action")
+        self.listen_event(self._invalidate_friendly, event="entity_registry_updated")
 
         # If vacation mode is already on at startup, start periodic checking
         if self.get_state(self.VACATION_MODE) == "on":
@@ -56,9 +61,6 @@ class LeftOnNotifier(BaseApp):
 
     def on_house_unoccupied(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """House became unoccupied - turn off outside lights, then check rest."""
-        if old == new:
-            return
-
         # In vacation mode, skip normal checking (vacation_check handles it)
         if self.get_state(self.VACATION_MODE) == "on":
             self.info("Vacation mode - skipping normal left-on check")
@@ -69,25 +71,31 @@ class LeftOnNotifier(BaseApp):
             self.call_service("homeassistant/turn_off", entity_id=self.OUTSIDE_GROUP)
             self.info("Turned off outside lights")
 
-        # Wait 2 minutes then check if anything still on
-        self.run_in(self._check_and_notify, WAIT_MINUTES * 60)
+        # Wait 2 minutes then check if anything still on (one pending check at most)
+        self._cancel_left_on_check()
+        self.left_on_check_timer = self.run_in(self._check_and_notify, WAIT_MINUTES * 60)
         self.info(f"Will check for things left on in {WAIT_MINUTES} minutes")
 
     def _check_and_notify(self, kwargs):
         """Check if anything still on and send notification."""
+        self.left_on_check_timer = None
+
         # Re-check house is still unoccupied
         if self.get_state(self.HOUSE_OCCUPIED) == "on":
             self.info("House occupied again, skipping notification")
             return
 
-        on_entities = self._get_on_entities()
+        # One state snapshot for the whole check instead of a read per entity
+        # (copy=False: only read here, so skip deep-copying the namespace)
+        states = self.get_state(copy=False) or {}
+        on_entities = self._get_on_entities(states)
 
         if not on_entities:
             self.info("Everything is off")
             return
 
         # Build message with entity names
-        names = [self._friendly_name(e) for e in on_entities]
+        names = [self._friendly_name(states, e) for e in on_entities]
         time_str = self.datetime().strftime("%H:%M")
         message = f"At {time_str} House is empty, and this are on: {', '.join(names)}"
 
@@ -107,6 +115,12 @@ class LeftOnNotifier(BaseApp):
         )
         self.info(f"Sent notification: {message}")
 
+    def _cancel_left_on_check(self):
+        """Cancel pending left-on check."""
+        if self.left_on_check_timer is not None:
+            self.cancel_timer(self.left_on_check_timer)
+            self.left_on_check_timer = None
+
     def on_action_triggered(self, event_type: str, data: dict, **kwargs):
         """Handle notification action button press."""
         action = data.get("action")
@@ -115,36 +129,41 @@ class LeftOnNotifier(BaseApp):
             self.call_service("homeassistant/turn_off", entity_id=self.ALL_DEVICES_GROUP)
             self.info("Turned everything off via notification action")
 
-    def _get_on_entities(self) -> list[str]:
-        """Get list of entities in group that are on."""
-        group_state = self.get_state(self.ALL_DEVICES_GROUP, attribute="all")
+    def _get_on_entities(self, states: dict) -> list[str]:
+        """Get list of entities in group that are on, using a state snapshot."""
+        group_state = states.get(self.ALL_DEVICES_GROUP)
         if not group_state:
             return []
 
         entity_ids = group_state.get("attributes", {}).get("entity_id", [])
-        on_entities = []
-
-        for entity_id in entity_ids:
-            state = self.get_state(entity_id)
-            if state not in ["off", "unknown", "unavailable"]:
-                on_entities.append(entity_id)
-
-        return on_entities
-
-    def _friendly_name(self, entity_id: str) -> str:
-        """Get friendly name for an entity."""
-        state = self.get_state(entity_id, attribute="all")
+        return [
+            entity_id
+            for entity_id in entity_ids
+            if states.get(entity_id, {}).get("state") not in ("off", "unknown", "unavailable", None)
+        ]
+
+    def _friendly_name(self, states: dict, entity_id: str) -> str:
+        """Get friendly name for an entity, memoized across notifications."""
+        name = self._friendly_cache.get(entity_id)
+        if name is not None:
+            return name
+
+        state = states.get(entity_id)
         if state and "attributes" in state:
-            return state["attributes"].get("friendly_name", entity_id)
+            name = state["attributes"].get("friendly_name")
+            if name:
+                self._friendly_cache[entity_id] = name
+                return name
         return entity_id
 
+    def _invalidate_friendly(self, event_type: str, data: dict, **kwargs):
+        """Entity registry changed - drop memoized friendly names."""
+        self._friendly_cache.clear()
+
     # --- Vacation mode handling ---
 
     def _on_vacation_mode_change(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Vacation mode changed - start or stop periodic checking."""
-        if old == new:
-            return
-
         if new == "on":
             # Start periodic checking every 2 hours
             self._start_vacation_check()
@@ -165,7 +184,7 @@ class LeftOnNotifier(BaseApp):
 
     def _cancel_vacation_check(self):
         """Cancel vacation mode periodic check."""
-        if self.vacation_check_timer:
+        if self.vacation_check_timer is not None:
             self.cancel_timer(self.vacation_check_timer)
             self.vacation_check_timer = None
 
@@ -177,13 +196,14 @@ class LeftOnNotifier(BaseApp):
         if self.get_state(self.HOUSE_OCCUPIED) == "on":
             return
 
-        on_entities = self._get_on_entities()
+        states = self.get_state(copy=False) or {}
+        on_entities = self._get_on_entities(states)
 
         if not on_entities:
             return
 
         # Build message
-        names = [self._friendly_name(e) for e in on_entities]
+        names = [self._friendly_name(states, e) for e in on_entities]
         message = f"Vacation mode: these have been on for a while: {', '.join(names)}"
 
         self.send_notification(
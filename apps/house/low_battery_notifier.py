@@ -5,19 +5,34 @@ Monitors all battery sensors and alerts when any drop below threshold.
 Behavior:
 - Runs daily at 10:00 AM
 - Checks all sensors with 'battery' in the entity ID
+- Battery entity list is cached and rebuilt when the entity registry changes
 - Filters for sensors with numeric values (skips unavailable/unknown)
 - Alerts Javier if any battery is below 20%
 - Groups all low batteries into a single notification
 """
 
+import re
+
 from common import BaseApp
 
 LOW_BATTERY_THRESHOLD = 20
 
+# Any sensor with "battery" in its ID (phone_battery_level, battery_phone,
+# x_battery_percent, ...) except the known non-level ones like _battery_health
+BATTERY_LEVEL_RE = re.compile(
+    r"battery(?!_(?:charger_type|charging|health|power|state|temperature|voltage)$)"
+)
+
 
 class LowBatteryNotifier(BaseApp):
 
     def initialize(self):
+        # Battery sensor entity IDs, built lazily from the sensor domain
+        self._battery_entities: list[str] | None = None
+
+        # Rebuild the battery entity list when entities are added/removed
+        self.listen_event(self._on_entity_registry_updated, event="entity_registry_updated")
+
         # Run daily at 10:00 AM
         self.run_daily(self._check_batteries, "10:00:00")
 
@@ -26,24 +41,38 @@ class LowBatteryNotifier(BaseApp):
 
         self.info("Low battery notifier initialized")
 
+    def _on_entity_registry_updated(self, event_type: str, data: dict, **kwargs):
+        """Entity registry changed - rebuild battery entity list on next check."""
+        self._battery_entities = None
+
+    def _find_battery_entities(self, sensors: dict) -> list[str]:
+        """Filter sensor entity IDs down to battery level sensors."""
+        battery_entities = []
+
+        for entity_id in sensors:
+            # 'battery' in the name, minus non-level sensors (health, state, etc.)
+            if BATTERY_LEVEL_RE.search(entity_id):
+                battery_entities.append(entity_id)
+
+        return battery_entities
+
     def _check_batteries(self, kwargs):
         """Check all battery sensors and notify if any are low."""
         low_batteries: list[tuple[str, float]] = []
 
-        # Get all entities and filter for battery sensors
-        all_states = self.get_state()
-        if not all_states:
+        # Only fetch the sensor domain, not the whole state machine
+        sensors = self.get_state("sensor")
+        if not sensors:
             return
 
-        for entity_id, state_info in all_states.items():
-            # Only check sensors with 'battery' in the name
-            if not entity_id.startswith("sensor.") or "battery" not in entity_id:
-                continue
+        if self._battery_entities is None:
+            self._battery_entities = self._find_battery_entities(sensors)
+            self.debug("Tracking %s battery sensors", len(self._battery_entities))
 
-            # Skip non-level sensors (health, state, temperature, etc.)
-            if not any(x in entity_id for x in ["_level", "_battery"]):
-                if "_battery_" in entity_id:
-                    continue
+        for entity_id in self._battery_entities:
+            state_info = sensors.get(entity_id)
+            if not state_info:
+                continue
 
             state = state_info.get("state")
             if state in ("unavailable", "unknown", None):
@@ -70,8 +99,7 @@ class LowBatteryNotifier(BaseApp):
         low_batteries.sort(key=lambda x: x[1])
 
         # Build notification message
-        lines = [f"• {name}: {level:.0f}%" for name, level in low_batteries]
-        message = "\n".join(lines)
+        message = "\n".join(f"• {name}: {level:.0f}%" for name, level in low_batteries)
 
         self.send_notification(
             targets=["javier"],
@@ -34,29 +34,37 @@ class HouseOccupancy(BaseApp):
     HOUSE_OCCUPIED = "input_boolean.house_occupied"
     GUEST_MODE = "input_boolean.guest_mode"
 
+    PEOPLE = {
+        JAVIER: "Javier",
+        ANDY: "Andy",
+    }
+
     def initialize(self):
         self.departure_timer = None
 
-        self.listen_state(self.on_javier_presence, self.JAVIER)
-        self.listen_state(self.on_andy_presence, self.ANDY)
+        for entity, name in self.PEOPLE.items():
+            self.listen_state(self.on_presence, entity, person_name=name)
 
         self.info("House occupancy initialized")
 
-    def on_javier_presence(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        if old == new:
-            return
+    def on_presence(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        name = kwargs["person_name"]
         if new == "home":
-            self._on_person_arrived("Javier")
+            self._on_person_arrived(name)
         else:
-            self._on_person_left("Javier")
+            self._on_person_left(name)
 
-    def on_andy_presence(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        if old == new:
-            return
-        if new == "home":
-            self._on_person_arrived("Andy")
-        else:
-            self._on_person_left("Andy")
+    def _stay_occupied_reason(self) -> str | None:
+        """Return why the house should stay occupied, or None if it shouldn't.
+
+        Reads both people from one person-domain snapshot.
+        """
+        people = self.get_state("person") or {}
+        if any(people.get(entity, {}).get("state") == "home" for entity in self.PEOPLE):
+            return "someone still home"
+        if self.get_state(self.GUEST_MODE) == "on":
+            return "guest mode ON"
+        return None
 
     def _request_other_location(self, name: str):
         """Request location update from the other person's phone."""
@@ -85,15 +93,9 @@ class HouseOccupancy(BaseApp):
         # Request location update from the other person (they often leave together)
         self._request_other_location(name)
 
-        javier_home = self.get_state(self.JAVIER) == "home"
-        andy_home = self.get_state(self.ANDY) == "home"
-
-        if javier_home or andy_home:
-            self.info(f"{name} left, but someone still home")
-            return
-
-        if self.get_state(self.GUEST_MODE) == "on":
-            self.info(f"{name} left, but guest mode ON")
+        reason = self._stay_occupied_reason()
+        if reason:
+            self.info(f"{name} left, but {reason}")
             return
 
         # Everyone left - start departure timer
@@ -109,15 +111,9 @@ class HouseOccupancy(BaseApp):
         self.departure_timer = None
 
         # Re-check conditions (someone may have returned)
-        javier_home = self.get_state(self.JAVIER) == "home"
-        andy_home = self.get_state(self.ANDY) == "home"
-
-        if javier_home or andy_home:
-            self.info("Timer expired but someone returned home")
-            return
-
-        if self.get_state(self.GUEST_MODE) == "on":
-            self.info("Timer expired but guest mode ON")
+        reason = self._stay_occupied_reason()
+        if reason:
+            self.info(f"Timer expired but {reason}")
             return
 
         if self.get_state(self.HOUSE_OCCUPIED) == "on":
@@ -126,6 +122,6 @@ class HouseOccupancy(BaseApp):
 
     def _cancel_departure(self):
         """Cancel pending departure timer."""
-        if self.departure_timer:
+        if self.departure_timer is not None:
             self.cancel_timer(self.departure_timer)
             self.departure_timer = None
@@ -27,6 +27,11 @@ class OutsideLights(BaseApp):
     def initialize(self):
         self.front_door_light_timer = None
 
+        self._occupied = self.mirror_state(self.HOUSE_OCCUPIED)
+        self._sun_below = self.mirror_state(self.SUN, "below_horizon")
+        self._front_open = self.mirror_state(self.FRONT_DOOR)
+        self._back_open = self.mirror_state(self.BACK_GATE)
+
         # Front door open/close
         self.listen_state(self.on_front_door_changed, self.FRONT_DOOR)
 
@@ -40,13 +45,10 @@ class OutsideLights(BaseApp):
 
     def on_front_door_changed(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Front door state changed - control front door light."""
-        if old == new:
-            return
-
-        if self.get_state(self.HOUSE_OCCUPIED) != "on":
+        if not self._occupied.value:
             return
 
-        if new == "on" and self.sun_down():
+        if new == "on" and self._sun_below.value:
             # Door opened after sunset - turn on light, cancel any pending off timer
             self._cancel_front_door_light_timer()
             self.call_service("homeassistant/turn_on", entity_id=self.FRONT_DOOR_LIGHT)
@@ -66,40 +68,35 @@ class OutsideLights(BaseApp):
 
     def _cancel_front_door_light_timer(self):
         """Cancel pending front door light timer."""
-        if self.front_door_light_timer:
+        if self.front_door_light_timer is not None:
             self.cancel_timer(self.front_door_light_timer)
             self.front_door_light_timer = None
 
     def on_back_gate_opened(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Back gate opened - turn on outside lights if dark and occupied."""
-        if old == new:
-            return
-
-        if self.get_state(self.HOUSE_OCCUPIED) != "on":
+        if not self._occupied.value:
             return
 
-        if self.sun_down():
+        if self._sun_below.value:
             self.call_service("homeassistant/turn_on", entity_id=self.OUTSIDE_LIGHTS)
             self.info("Back gate opened after sunset - turned on outside lights")
 
     def on_sun_down(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Sun went down - turn on lights if occupied."""
-        if old == new:
-            return
-
-        if self.get_state(self.HOUSE_OCCUPIED) != "on":
+        if not self._occupied.value:
             return
 
         # Always turn on stairs light at sunset
-        self.call_service("homeassistant/turn_on", entity_id=self.STAIRS_LIGHT)
-        self.info("Sun went down - turned on stairs light")
+        entities = [self.STAIRS_LIGHT]
 
         # Turn on front door light if front door is open
-        if self.get_state(self.FRONT_DOOR) == "on":
-            self.call_service("homeassistant/turn_on", entity_id=self.FRONT_DOOR_LIGHT)
-            self.info("Sun went down with front door open - turned on front door light")
+        if self._front_open.value:
+            entities.append(self.FRONT_DOOR_LIGHT)
 
         # Turn on outside lights if back gate is open
-        if self.get_state(self.BACK_GATE) == "on":
-            self.call_service("homeassistant/turn_on", entity_id=self.OUTSIDE_LIGHTS)
-            self.info("Sun went down with back gate open - turned on outside lights")
+        if self._back_open.value:
+            entities.append(self.OUTSIDE_LIGHTS)
+
+        # One service call for everything
+        self.call_service("homeassistant/turn_on", entity_id=entities)
+        self.info(f"Sun went down - turned on {', '.join(entities)}")
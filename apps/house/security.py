@@ -12,13 +12,28 @@ Entry point monitoring:
 Switch button monitoring:
 - When a Tasmota switch button is physically pressed while house is unoccupied
 - Send immediate security alert with device name
+- The first press from an unknown MAC alerts with the MAC, then the device
+  name is looked up in a deferred callback and memoized for later presses
+- tasmota_event is only subscribed while the house is unoccupied, so the
+  (chatty) Tasmota event stream never reaches this app while someone is home
 """
 
-from common import BaseApp
+import time
+
+from common import ENTRY_POINTS, BaseApp
 
 # Time to wait for occupancy after entry point opens while unoccupied
 ENTRY_ALERT_SECONDS = 30
 
+# Tasmota button events that count as a physical press
+PRESS_EVENTS = frozenset({"SINGLE", "HOLD"})
+
+# Notification data for security alerts (shared, don't mutate)
+HIGH_PRIORITY_DATA = {"priority": "high"}
+
+# Don't rescan switches for a MAC that wasn't found within this window
+MAC_MISS_TTL_SECONDS = 60 * 60
+
 
 class HouseSecurity(BaseApp):
 
@@ -26,48 +41,49 @@ class HouseSecurity(BaseApp):
     LIVING_ROOM_LIGHTS = "group.living_room_lights_and_switches"
     OUTSIDE_LIGHTS = "group.outside"
 
-    # Entry points
-    FRONT_DOOR = "binary_sensor.front_door_state"
-    BACK_GATE = "binary_sensor.back_gate_state"
-
-    ENTRY_POINTS = {
-        FRONT_DOOR: "Front door",
-        BACK_GATE: "Back gate",
-    }
-
     def initialize(self):
         self.entry_alert_timer = None
 
-        # Entry point monitoring
-        for entity in self.ENTRY_POINTS:
-            self.listen_state(self.on_entry_opened, entity, new="on")
+        # MAC -> device name, filled after the first press of each device
+        self.mac_to_name: dict[str, str] = {}
+        # MAC -> monotonic time of last lookup that found nothing (or is pending)
+        self._mac_misses: dict[str, float] = {}
+
+        # Kept current by _on_occupancy_change, which also (un)subscribes Tasmota
+        self._occupied = self.get_state(self.HOUSE_OCCUPIED) == "on"
 
-        # Tasmota button press monitoring
-        self.listen_event(self.on_tasmota_event, event="tasmota_event")
-        self._build_mac_to_name_cache()
+        # Entry point monitoring - one callback for all entry points, only
+        # dispatched on a real closed -> open transition
+        for entity in ENTRY_POINTS:
+            self.listen_state(self.on_entry_opened, entity, old="off", new="on")
+
+        # Tasmota button press monitoring (subscribed only while unoccupied)
+        self._tasmota_handle = None
+        self.listen_state(self._on_occupancy_change, self.HOUSE_OCCUPIED)
+        self._update_tasmota_subscription(self._occupied)
 
         self.info("House security initialized")
 
     def on_entry_opened(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Entry point opened - check if house is unoccupied and respond."""
-        if old == new:
+        if self._occupied:
             return
 
-        if self.get_state(self.HOUSE_OCCUPIED) == "on":
-            return
-
-        entry_name = self.ENTRY_POINTS.get(entity, "Unknown entry")
+        entry_name = ENTRY_POINTS.get(entity, "Unknown entry")
         self.info(f"{entry_name} opened while house unoccupied")
 
         # Request location updates from phones to speed up presence detection
-        self.call_service("notify/mobile_app_javier_phone", message="request_location_update")
-        self.call_service("notify/mobile_app_andy_phone", message="request_location_update")
+        # (fire-and-forget, both go out without waiting on each other)
+        self.fire_service("notify/mobile_app_javier_phone", message="request_location_update")
+        self.fire_service("notify/mobile_app_andy_phone", message="request_location_update")
         self.info("Requested location updates from phones")
 
         # Turn on lights if after sunset
         if self.sun_down():
-            self.call_service("homeassistant/turn_on", entity_id=self.LIVING_ROOM_LIGHTS)
-            self.call_service("homeassistant/turn_on", entity_id=self.OUTSIDE_LIGHTS)
+            self.fire_service(
+                "homeassistant/turn_on",
+                entity_id=[self.LIVING_ROOM_LIGHTS, self.OUTSIDE_LIGHTS],
+            )
             self.info("After sunset - turned on lights")
 
         # Start timer to alert if no occupancy change
@@ -83,36 +99,43 @@ class HouseSecurity(BaseApp):
         self.entry_alert_timer = None
 
         # Re-check if house is still unoccupied
-        if self.get_state(self.HOUSE_OCCUPIED) == "on":
+        if self._occupied:
             return
 
         entry_name = kwargs.get("entry_name", "Entry point")
-        time_str = self.datetime().strftime("%-I:%M %p")
+        time_str = self.time_str()
         self.send_notification(
             targets=["both"],
             message=f"{entry_name} opened at {time_str} but no one arrived!",
             title="Security Alert",
-            data={"priority": "high"},
+            data=HIGH_PRIORITY_DATA,
         )
         self.info(f"Alert: {entry_name} opened but no occupancy change detected")
 
     def _cancel_entry_alert(self):
         """Cancel pending entry alert timer."""
-        if self.entry_alert_timer:
-            self.cancel_timer(self.entry_alert_timer)
+        if self.entry_alert_timer is not None:
+            self.cancel_timer(self.entry_alert_timer, silent=True)
             self.entry_alert_timer = None
 
     # --- Tasmota button press monitoring ---
 
-    def _build_mac_to_name_cache(self):
-        """Build MAC to device name cache from Tasmota switch entities."""
-        self.mac_to_name: dict[str, str] = {}
+    def _schedule_device_lookup(self, mac: str):
+        """Resolve an unknown MAC's device name after the alert has gone out."""
+        missed_at = self._mac_misses.get(mac)
+        if missed_at is not None and time.monotonic() - missed_at < MAC_MISS_TTL_SECONDS:
+            return
 
+        # Stamped up front so a burst of presses schedules a single scan
+        self._mac_misses[mac] = time.monotonic()
+        self.run_in(self._on_lookup_device_name, 0, mac=mac)
+
+    def _on_lookup_device_name(self, kwargs):
+        """Find the Tasmota switch device with this MAC and memoize its name."""
+        mac = kwargs["mac"]
         try:
-            # Get all switch entities and check for Tasmota devices
-            switches = self.get_state("switch")
-            if not switches:
-                return
+            # Check switch entities for a Tasmota device with this MAC
+            switches = self.get_state("switch") or {}
 
             for entity_id in switches:
                 try:
@@ -125,47 +148,71 @@ class HouseSecurity(BaseApp):
                     if not connections:
                         continue
 
-                    # Find MAC in connections
-                    for conn in connections:
-                        if conn[0] == "mac":
-                            mac = conn[1].upper().replace(":", "")
-                            name = self.device_attr(device_id, "name_by_user")
-                            if not name:
-                                name = self.device_attr(device_id, "name")
-                            if name:
-                                self.mac_to_name[mac] = name
-                            break
+                    if not any(
+                        conn[0] == "mac" and conn[1].upper().replace(":", "") == mac
+                        for conn in connections
+                    ):
+                        continue
+
+                    name = self.device_attr(device_id, "name_by_user")
+                    if not name:
+                        name = self.device_attr(device_id, "name")
+                    if name:
+                        self.mac_to_name[mac] = name
+                        self._mac_misses.pop(mac, None)
+                        self.info(f"Cached device name for MAC {mac}: {name}")
+                        return
                 except Exception:
                     pass
-
-            self.info(f"Built MAC cache with {len(self.mac_to_name)} devices")
         except Exception as e:
-            self.info(f"Failed to build MAC cache: {e}")
-
-    def _get_device_name_by_mac(self, mac: str) -> str:
-        """Look up device name by MAC address."""
-        return self.mac_to_name.get(mac.upper(), "A light switch")
+            self.info(f"Failed to look up MAC {mac}: {e}")
+
+    def _on_occupancy_change(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        """House occupancy changed - update the flag and (un)subscribe from Tasmota events."""
+        self._occupied = new == "on"
+        if self._occupied:
+            # Someone arrived - a pending entry alert would only re-check and return
+            self._cancel_entry_alert()
+        self._update_tasmota_subscription(self._occupied)
+
+    def _update_tasmota_subscription(self, occupied: bool):
+        """Listen to tasmota_event only while the house is unoccupied."""
+        if occupied and self._tasmota_handle is not None:
+            self.cancel_listen_event(self._tasmota_handle)
+            self._tasmota_handle = None
+            self.debug("House occupied - stopped listening to Tasmota events")
+        elif not occupied and self._tasmota_handle is None:
+            self._tasmota_handle = self.listen_event(self.on_tasmota_event, event="tasmota_event")
+            self.debug("House unoccupied - listening to Tasmota events")
 
     def on_tasmota_event(self, event_type: str, data: dict, **kwargs):
         """Handle Tasmota button press events."""
         event = data.get("event")
 
         # Only react to physical button presses
-        if event not in ("SINGLE", "HOLD"):
+        if event not in PRESS_EVENTS:
             return
 
         # Only alert if house is unoccupied
-        if self.get_state(self.HOUSE_OCCUPIED) == "on":
+        if self._occupied:
             return
 
-        mac = data.get("mac", "").upper()
-        device_name = self._get_device_name_by_mac(mac)
+        # Normalize once; cache keys are already uppercase without colons
+        mac = data.get("mac")
+        mac = mac.upper() if mac else ""
+        device_name = self.mac_to_name.get(mac)
+        if device_name is None:
+            # Unknown device - alert with the MAC now, resolve the name below
+            device_name = f"Light switch {mac}" if mac else "A light switch"
 
-        time_str = self.datetime().strftime("%-I:%M %p")
+        time_str = self.time_str()
         self.send_notification(
             targets=["both"],
             message=f"{device_name} was pressed at {time_str} while house is unoccupied!",
             title="Security Alert",
-            data={"priority": "high"},
+            data=HIGH_PRIORITY_DATA,
         )
         self.info(f"Alert: {device_name} button pressed while house unoccupied")
+
+        if mac and mac not in self.mac_to_name:
+            self._schedule_device_lookup(mac)
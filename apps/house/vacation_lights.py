@@ -9,11 +9,15 @@ Pattern:
       This resets the left_on_notifier timer and looks more natural
     - After ~2 hours total: turn off for the night
 
+    The randomized off/on cycles for a session are generated up front when
+    the lights come on and scheduled at absolute times with run_at.
+
 The brief off/on cycles ensure we never trigger the 2-hour vacation alert
 in left_on_notifier, while making the house look lived-in.
 """
 
 import random
+from datetime import timedelta
 
 from common import BaseApp
 
@@ -38,61 +42,62 @@ class VacationLights(BaseApp):
     LIVING_ROOM_LIGHTS = "group.living_room_lights_and_switches"
 
     def initialize(self):
-        self.sunset_timer = None
-        self.cycle_timer = None
-        self.turn_on_timer = None
-        self.end_timer = None
+        # Every pending timer handle for the current session (some may have fired)
+        self._timers: list[str] = []
         self.session_start = None
 
+        # Kept in sync by _on_vacation_mode_on/_on_vacation_mode_off
+        self._vacation = self.get_state(self.VACATION_MODE) == "on"
+
         # React to vacation mode changes
-        self.listen_state(self._on_vacation_mode_change, self.VACATION_MODE)
+        self.listen_state(self._on_vacation_mode_on, self.VACATION_MODE, new="on")
+        self.listen_state(self._on_vacation_mode_off, self.VACATION_MODE, old="on")
 
         # React to sunset when in vacation mode
         self.run_at_sunset(self._on_sunset)
 
         # If vacation mode is already on, check if we should be running
-        if self.get_state(self.VACATION_MODE) == "on":
+        if self._vacation:
             self._check_current_state()
 
         self.info("Vacation lights initialized")
 
-    def _on_vacation_mode_change(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        """Vacation mode changed."""
-        if old == new:
-            return
+    def _on_vacation_mode_on(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        """Vacation mode turned on."""
+        self._vacation = True
+        self.info("Vacation mode ON - will start lights at sunset")
+        self._check_current_state()
 
-        if new == "on":
-            self.info("Vacation mode ON - will start lights at sunset")
-            self._check_current_state()
-        else:
-            self.info("Vacation mode OFF - stopping vacation lights")
-            self._cancel_all_timers()
-            # Turn off lights if we had them on
-            self.call_service("homeassistant/turn_off", entity_id=self.LIVING_ROOM_LIGHTS)
+    def _on_vacation_mode_off(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        """Vacation mode left "on" (turned off or became unavailable)."""
+        self._vacation = False
+        self.info("Vacation mode OFF - stopping vacation lights")
+        self._cancel_all_timers()
+        # Turn off lights if we had them on
+        self.call_service("homeassistant/turn_off", entity_id=self.LIVING_ROOM_LIGHTS)
 
     def _check_current_state(self):
         """Check if we should start lights now (e.g., vacation mode enabled after sunset, or restart)."""
-        if self.get_state(self.VACATION_MODE) != "on":
+        if not self._vacation:
             return
 
         # If lights are already on, we probably restarted mid-session
         # Resume the cycling pattern
         if self.get_state(self.LIVING_ROOM_LIGHTS) == "on" and self.sun_down():
             self.info("Lights already on after restart, resuming cycle pattern")
-            self._schedule_next_cycle()
-            # Schedule end of session (assume we're partway through, give 1 hour)
-            self.end_timer = self.run_in(self._end_session, 60 * 60)
+            # Assume we're partway through, give 1 hour
+            self._schedule_session(60 * 60)
             return
 
         if self.sun_down():
             # Already past sunset, start lights with short delay
             delay = random.randint(1, 5) * 60  # 1-5 minutes
-            self.sunset_timer = self.run_in(self._start_lights, delay)
+            self._timers.append(self.run_in(self._start_lights, delay))
             self.info(f"Past sunset, starting lights in {delay // 60} minutes")
 
     def _on_sunset(self, kwargs):
         """Sunset occurred - start lights if in vacation mode."""
-        if self.get_state(self.VACATION_MODE) != "on":
+        if not self._vacation:
             return
 
         # Random delay after sunset
@@ -102,54 +107,50 @@ class VacationLights(BaseApp):
         delay_seconds = delay_minutes * 60
 
         self._cancel_all_timers()
-        self.sunset_timer = self.run_in(self._start_lights, delay_seconds)
+        self._timers.append(self.run_in(self._start_lights, delay_seconds))
         self.info(f"Sunset detected, will turn on lights in {delay_minutes} minutes")
 
     def _start_lights(self, kwargs):
-        """Turn on lights and start cycling pattern."""
-        if self.get_state(self.VACATION_MODE) != "on":
+        """Turn on lights and schedule the whole session."""
+        if not self._vacation:
             return
 
         self.session_start = self.datetime()
         self.call_service("homeassistant/turn_on", entity_id=self.LIVING_ROOM_LIGHTS)
         self.info("Vacation lights ON")
 
-        # Schedule first cycle
-        self._schedule_next_cycle()
-
-        # Schedule end of session
-        self.end_timer = self.run_in(self._end_session, TOTAL_ON_DURATION_MINUTES * 60)
-
-    def _schedule_next_cycle(self):
-        """Schedule the next off/on cycle."""
-        # Random interval for next cycle
-        interval_minutes = CYCLE_INTERVAL_BASE_MINUTES + random.randint(
-            -CYCLE_INTERVAL_VARIANCE_MINUTES, CYCLE_INTERVAL_VARIANCE_MINUTES
-        )
-        self.cycle_timer = self.run_in(self._cycle_off, interval_minutes * 60)
-        self.debug(f"Next cycle in {interval_minutes} minutes")
-
-    def _cycle_off(self, kwargs):
-        """Turn off lights briefly."""
-        if self.get_state(self.VACATION_MODE) != "on":
-            return
-
-        self.call_service("homeassistant/turn_off", entity_id=self.LIVING_ROOM_LIGHTS)
-        self.debug("Cycle: lights OFF")
-
-        # Schedule turn back on
-        self.turn_on_timer = self.run_in(self._cycle_on, CYCLE_OFF_SECONDS)
-
-    def _cycle_on(self, kwargs):
-        """Turn lights back on after brief off period."""
-        if self.get_state(self.VACATION_MODE) != "on":
+        self._schedule_session(TOTAL_ON_DURATION_MINUTES * 60)
+
+    def _schedule_session(self, session_seconds: int):
+        """Schedule every off/on toggle and the session end at absolute times."""
+        now = self.datetime()
+        offset = 0
+        cycles = 0
+        while True:
+            # Random interval for next cycle
+            offset += 60 * (CYCLE_INTERVAL_BASE_MINUTES + random.randint(
+                -CYCLE_INTERVAL_VARIANCE_MINUTES, CYCLE_INTERVAL_VARIANCE_MINUTES
+            ))
+            if offset + CYCLE_OFF_SECONDS >= session_seconds:
+                break
+            off_at = now + timedelta(seconds=offset)
+            on_at = off_at + timedelta(seconds=CYCLE_OFF_SECONDS)
+            self._timers.append(self.run_at(self._apply_state, off_at, state="off"))
+            self._timers.append(self.run_at(self._apply_state, on_at, state="on"))
+            cycles += 1
+
+        session_end = now + timedelta(seconds=session_seconds)
+        self._timers.append(self.run_at(self._end_session, session_end))
+        self.debug(f"Scheduled {cycles} cycles over {session_seconds // 60} minutes")
+
+    def _apply_state(self, kwargs):
+        """Cycle step - turn lights briefly off, or back on (kwargs["state"])."""
+        if not self._vacation:
             return
 
-        self.call_service("homeassistant/turn_on", entity_id=self.LIVING_ROOM_LIGHTS)
-        self.debug("Cycle: lights ON")
-
-        # Schedule next cycle
-        self._schedule_next_cycle()
+        state = kwargs["state"]
+        self.call_service(f"homeassistant/turn_{state}", entity_id=self.LIVING_ROOM_LIGHTS)
+        self.debug(f"Cycle: lights {state.upper()}")
 
     def _end_session(self, kwargs):
         """End the vacation lights session for the night."""
@@ -159,8 +160,7 @@ class VacationLights(BaseApp):
 
     def _cancel_all_timers(self):
         """Cancel all pending timers."""
-        for timer_name in ["sunset_timer", "cycle_timer", "turn_on_timer", "end_timer"]:
-            timer = getattr(self, timer_name, None)
-            if timer:
-                self.cancel_timer(timer)
-                setattr(self, timer_name, None)
+        for timer in self._timers:
+            # Silent: handles of timers that already fired are still in the list
+            self.cancel_timer(timer, silent=True)
+        self._timers.clear()
@@ -39,23 +39,47 @@ FAR_FROM_HOME_KM = 100
 # Action identifier for the notification
 ACTION_ENABLE_VACATION = "ENABLE_VACATION_MODE"
 
-
-def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+# Notification data offering the enable action (shared, don't mutate)
+VACATION_ACTIONS_DATA = {
+    "actions": [
+        {
+            "action": ACTION_ENABLE_VACATION,
+            "title": "Activar",
+        },
+    ],
+}
+
+# Attribute holding the ISO country code - Android uses lowercase, iOS title case
+ANDROID_COUNTRY_KEY = "iso_country_code"
+IOS_COUNTRY_KEY = "ISO Country Code"
+
+# Earth's diameter in kilometers (2 * 6371km radius)
+EARTH_DIAMETER_KM = 12742.0
+
+
+def haversine_distance(
+    lat1: float,
+    lon1: float,
+    lat2: float,
+    lon2: float,
+    _sin=sin,
+    _cos=cos,
+    _asin=asin,
+    _sqrt=sqrt,
+    _radians=radians,
+) -> float:
     """Calculate distance between two GPS coordinates in kilometers.
 
-    Uses the Haversine formula for great-circle distance.
+    Uses the Haversine formula for great-circle distance. The underscore
+    defaults bind the math functions as locals - don't pass them.
     """
-    # Earth's radius in kilometers
-    R = 6371
-
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-
-    a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-    c = 2 * asin(sqrt(a))
+    lat1_r = _radians(lat1)
+    lat2_r = _radians(lat2)
+    dlat = lat2_r - lat1_r
+    dlon = _radians(lon2 - lon1)
 
-    return R * c
+    a = _sin(dlat * 0.5) ** 2 + _cos(lat1_r) * _cos(lat2_r) * _sin(dlon * 0.5) ** 2
+    return EARTH_DIAMETER_KM * _asin(_sqrt(a))
 
 
 class VacationMode(BaseApp):
@@ -74,18 +98,20 @@ class VacationMode(BaseApp):
         # Reset when someone comes home
         self.notification_sent = False
 
+        # Home zone doesn't move - fetched once (lazily retried if not loaded yet)
+        self._home_coords = self._get_home_coords()
+
+        self._vacation = self.mirror_state(self.VACATION_MODE)
+
+        # Country code attribute per geocoded sensor (phone platform is fixed)
+        self._country_key: dict[str, str] = {
+            self.JAVIER_GEOCODED: self._probe_country_key(self.JAVIER_GEOCODED, ANDROID_COUNTRY_KEY),
+            self.ANDY_GEOCODED: self._probe_country_key(self.ANDY_GEOCODED, IOS_COUNTRY_KEY),
+        }
+
         # React instantly to geocoded location changes (country attribute)
-        # Android uses lowercase, iOS uses title case
-        self.listen_state(
-            self._on_location_change,
-            self.JAVIER_GEOCODED,
-            attribute="iso_country_code",  # Android
-        )
-        self.listen_state(
-            self._on_location_change,
-            self.ANDY_GEOCODED,
-            attribute="ISO Country Code",  # iOS
-        )
+        for geocoded_entity, country_key in self._country_key.items():
+            self.listen_state(self._on_location_change, geocoded_entity, attribute=country_key)
 
         # Also check on startup
         self.run_in(self._check_vacation, 5)
@@ -102,9 +128,9 @@ class VacationMode(BaseApp):
 
         self.info("Vacation mode initialized")
 
-    def _get_home_coords(self) -> tuple[float, float] | None:
-        """Get home zone coordinates."""
-        state = self.get_state(self.HOME_ZONE, attribute="all")
+    @staticmethod
+    def _coords_from_state(state: dict | None) -> tuple[float, float] | None:
+        """Extract (latitude, longitude) from a full state dict."""
         if not state:
             return None
         attrs = state.get("attributes", {})
@@ -114,39 +140,48 @@ class VacationMode(BaseApp):
             return None
         return (lat, lon)
 
+    def _probe_country_key(self, geocoded_entity: str, default: str) -> str:
+        """Find which attribute holds the country code for this sensor."""
+        attrs = (self.get_state(geocoded_entity, attribute="all") or {}).get("attributes", {})
+        for key in (ANDROID_COUNTRY_KEY, IOS_COUNTRY_KEY):
+            if key in attrs:
+                return key
+        return default
+
+    def _get_home_coords(self) -> tuple[float, float] | None:
+        """Get home zone coordinates."""
+        return self._coords_from_state(self.get_state(self.HOME_ZONE, attribute="all"))
+
     def _get_phone_coords(self, entity_id: str) -> tuple[float, float] | None:
         """Get phone GPS coordinates."""
-        state = self.get_state(entity_id, attribute="all")
-        if not state:
-            return None
-        attrs = state.get("attributes", {})
-        lat = attrs.get("latitude")
-        lon = attrs.get("longitude")
-        if lat is None or lon is None:
-            return None
-        return (lat, lon)
+        return self._coords_from_state(self.get_state(entity_id, attribute="all"))
+
+    def _person_country_status(self, geocoded_entity: str, name: str) -> bool | None:
+        """Check if a person is abroad based on geocoded country.
 
-    def _is_person_far(self, geocoded_entity: str, tracker_entity: str, name: str) -> bool:
-        """Check if a person is far from home.
-        
-        First tries country from geocoded location, falls back to GPS distance.
+        Returns None when no country code is available (use distance instead).
         """
-        # Try country check first (more reliable when available)
         geocoded = self.get_state(geocoded_entity, attribute="all")
-        if geocoded:
-            attrs = geocoded.get("attributes", {})
-            # iOS uses "ISO Country Code", Android uses "iso_country_code"
-            country_code = attrs.get("ISO Country Code") or attrs.get("iso_country_code")
-            if country_code:
-                is_abroad = country_code != HOME_COUNTRY
-                self.debug(f"{name} country: {country_code}, abroad={is_abroad}")
-                return is_abroad
-
-        # Fallback to distance calculation
-        home = self._get_home_coords()
+        if not geocoded:
+            return None
+
+        country_code = geocoded.get("attributes", {}).get(self._country_key[geocoded_entity])
+        if not country_code:
+            return None
+
+        is_abroad = country_code != HOME_COUNTRY
+        self.debug(f"{name} country: {country_code}, abroad={is_abroad}")
+        return is_abroad
+
+    def _person_distance_status(self, tracker_entity: str, name: str) -> bool:
+        """Check if a person is far from home by GPS distance (fallback)."""
+        if self._home_coords is None:
+            self._home_coords = self._get_home_coords()
+        home = self._home_coords
         if not home:
             return False
 
+        # Read on demand - only needed when a country code is missing
         coords = self._get_phone_coords(tracker_entity)
         if not coords:
             return False
@@ -158,23 +193,32 @@ class VacationMode(BaseApp):
 
     def _on_location_change(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Geocoded location country changed - check if we should suggest vacation mode."""
-        if old == new:
-            return
         self.info(f"Location country changed: {entity} {old} -> {new}")
         self._check_vacation(kwargs)
 
     def _check_vacation(self, kwargs):
         """Check if both people are far from home."""
         # Skip if vacation mode already on
-        if self.get_state(self.VACATION_MODE) == "on":
+        if self._vacation.value:
             return
 
         # Skip if we already sent notification this trip
         if self.notification_sent:
             return
 
-        javier_far = self._is_person_far(self.JAVIER_GEOCODED, self.JAVIER_PHONE, "Javier")
-        andy_far = self._is_person_far(self.ANDY_GEOCODED, self.ANDY_PHONE, "Andy")
+        # Country code is decisive when present (more reliable than GPS)
+        javier_far = self._person_country_status(self.JAVIER_GEOCODED, "Javier")
+        andy_far = self._person_country_status(self.ANDY_GEOCODED, "Andy")
+
+        # Someone in the home country - no need to look at distances
+        if javier_far is False or andy_far is False:
+            return
+
+        # Fallback to distance only for whoever has no country data
+        if javier_far is None:
+            javier_far = self._person_distance_status(self.JAVIER_PHONE, "Javier")
+        if andy_far is None:
+            andy_far = self._person_distance_status(self.ANDY_PHONE, "Andy")
 
         # Only suggest vacation mode if BOTH are far
         if javier_far and andy_far:
@@ -188,14 +232,7 @@ class VacationMode(BaseApp):
             targets=["javier"],
             title="Modo Vacaciones",
             message="Detectamos que están lejos de casa. ¿Activar modo vacaciones?",
-            data={
-                "actions": [
-                    {
-                        "action": ACTION_ENABLE_VACATION,
-                        "title": "Activar",
-                    },
-                ],
-            },
+            data=VACATION_ACTIONS_DATA,
         )
         self.info("Sent vacation mode notification")
 
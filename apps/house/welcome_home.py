@@ -15,6 +15,9 @@ TTS Logic:
    detection (GPS/WiFi) might fire BEFORE the person physically enters. By
    listening to the door, we ensure they're actually walking in.
 
+   Openings within the TTS delay (e.g. stepping out and back in) share a
+   single check, so the welcome is never played twice.
+
    Three scenarios:
    
    a) Door opens, house NOT yet occupied (presence detection slow):
@@ -30,7 +33,10 @@ TTS Logic:
       Someone's already home, no need to announce arrivals.
 """
 
-from common import BaseApp
+import time
+from datetime import datetime
+
+from common import ENTRY_POINTS, BaseApp
 
 # Time window to consider "just became occupied" (accounts for parking, walking, etc.)
 RECENT_OCCUPIED_SECONDS = 300
@@ -44,8 +50,6 @@ class WelcomeHome(BaseApp):
     HOUSE_OCCUPIED = "input_boolean.house_occupied"
     LIVING_ROOM_LIGHTS = "group.living_room_lights_and_switches"
     OUTSIDE_LIGHTS = "group.outside"
-    FRONT_DOOR = "binary_sensor.front_door_state"
-    BACK_GATE = "binary_sensor.back_gate_state"
     JAVIER = "person.javier"
     ANDY = "person.andy"
 
@@ -53,17 +57,41 @@ class WelcomeHome(BaseApp):
         # Track who was home before door opened
         self.presence_before_door: dict[str, bool] = {}
 
+        # Pending welcome TTS check - extra door openings while set are ignored
+        self._pending_welcome_timer = None
+
+        # Kept in sync by on_occupied_changed
+        self._occupied = self.get_state(self.HOUSE_OCCUPIED) == "on"
+
+        # Monotonic time house_occupied last turned on (None if unknown)
+        self._last_occupied_monotonic = self._initial_occupied_monotonic()
+
         self.listen_state(self.on_occupied_changed, self.HOUSE_OCCUPIED)
-        self.listen_state(self.on_entry_point, self.FRONT_DOOR, new="on")
-        self.listen_state(self.on_entry_point, self.BACK_GATE, new="on")
+        for entity in ENTRY_POINTS:
+            self.listen_state(self.on_entry_point, entity, old="off", new="on")
         self.info("Welcome home initialized")
 
+    def _initial_occupied_monotonic(self) -> float | None:
+        """Seed the last occupied time from last_changed at startup (restart safety)."""
+        if not self._occupied:
+            return None
+
+        occupied_state = self.get_state(self.HOUSE_OCCUPIED, attribute="all") or {}
+        last_changed = occupied_state.get("last_changed")
+        if not last_changed:
+            return None
+
+        changed_ts = datetime.fromisoformat(last_changed.replace("Z", "+00:00")).timestamp()
+        seconds_ago = time.time() - changed_ts
+        return time.monotonic() - seconds_ago
+
     def on_occupied_changed(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """House occupancy changed - handle lights and notifications."""
-        if old == new:
-            return
+        self._occupied = new == "on"
+        if self._occupied:
+            self._last_occupied_monotonic = time.monotonic()
 
-        time_str = self.datetime().strftime("%-I:%M %p")
+        time_str = self.time_str()
 
         if new == "on":
             self.info("House became occupied")
@@ -90,6 +118,11 @@ class WelcomeHome(BaseApp):
 
     def on_entry_point(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Entry point opened (front door or back gate) - check if we should play welcome TTS."""
+        # Door opened again before the check ran (e.g. stepped out and back in)
+        if self._pending_welcome_timer is not None:
+            self.debug("Welcome check already pending, ignoring door opening")
+            return
+
         # Snapshot current presence before it might change
         self.presence_before_door = {
             "javier": self.get_state(self.JAVIER) == "home",
@@ -97,14 +130,14 @@ class WelcomeHome(BaseApp):
         }
 
         # Schedule TTS check after delay (person needs to get inside)
-        self.run_in(self._check_and_play_welcome, TTS_DELAY_SECONDS)
+        self._pending_welcome_timer = self.run_in(self._check_and_play_welcome, TTS_DELAY_SECONDS)
         self.info(f"Door opened, presence snapshot: {self.presence_before_door}")
 
     def _check_and_play_welcome(self, kwargs):
         """Check arrival status and play welcome TTS only for first arrival."""
-        house_occupied = self.get_state(self.HOUSE_OCCUPIED) == "on"
+        self._pending_welcome_timer = None
 
-        if not house_occupied:
+        if not self._occupied:
             # House not yet occupied - presence detection is slow
             # Play softer welcome while we figure things out
             self.tts_first_floor("Bienvenidos a casa, detectando presencia")
@@ -112,17 +145,9 @@ class WelcomeHome(BaseApp):
             return
 
         # Check if house_occupied recently turned on
-        occupied_state = self.get_state(self.HOUSE_OCCUPIED, attribute="all") or {}
-        last_changed = occupied_state.get("last_changed")
-
         house_just_occupied = False
-        if last_changed:
-            # Parse last_changed and check if within threshold
-            from datetime import datetime, timezone
-
-            changed_dt = datetime.fromisoformat(last_changed.replace("Z", "+00:00"))
-            now = datetime.now(timezone.utc)
-            seconds_ago = (now - changed_dt).total_seconds()
+        if self._last_occupied_monotonic is not None:
+            seconds_ago = time.monotonic() - self._last_occupied_monotonic
             house_just_occupied = seconds_ago < RECENT_OCCUPIED_SECONDS
             self.info(f"House occupied changed {seconds_ago:.0f}s ago")
 
@@ -18,11 +18,17 @@ Sticky mode:
 - While active, cancels any pending off timer
 """
 
-from common import BaseApp
+import datetime
+import time
+
+from common import BaseApp, DeadlineTimer
 
 # How long entrance motion is considered "recent" for validating kitchen motion
 ENTRANCE_LOOKBACK_SECONDS = 30
 
+# Motion sensor states that count as "no motion"
+CLEAR_STATES = frozenset({"off", "unavailable"})
+
 
 class KitchenMotionLight(BaseApp):
 
@@ -35,85 +41,100 @@ class KitchenMotionLight(BaseApp):
     OFF_DELAY = 45  # seconds after motion clears
 
     def initialize(self):
-        self.timer_handle = None
+        self.off_timer = DeadlineTimer(self, self._turn_off_light)
         self.motion_triggered_light = False
 
-        self.listen_state(self.on_kitchen_motion, self.KITCHEN_MOTION)
-        self.listen_state(self.on_entrance_motion, self.ENTRANCE_MOTION)
+        self._occupied = self.mirror_state(self.HOUSE_OCCUPIED)
+        self._sticky_on = self.mirror_state(self.STICKY_MODE)
+
+        # Monotonic time the entrance sensor last turned on/off (None if unknown)
+        self._last_entrance_change = self._initial_entrance_change()
+
+        # Separate on/off subscriptions so AppDaemon does the filtering
+        self.listen_state(self.on_kitchen_motion_on, self.KITCHEN_MOTION, new="on")
+        self.listen_state(self.on_kitchen_motion_off, self.KITCHEN_MOTION, new="off")
+        self.listen_state(self.on_entrance_motion_on, self.ENTRANCE_MOTION, new="on")
+        self.listen_state(self.on_entrance_motion_off, self.ENTRANCE_MOTION, new="off")
         self.listen_state(self.on_light_change, self.LIGHT_SWITCH)
-        self.listen_state(self.on_sticky_change, self.STICKY_MODE)
+        self.listen_state(self.on_sticky_on, self.STICKY_MODE, new="on")
 
         self.info("Kitchen motion light initialized")
 
     # --- Motion handlers ---
 
-    def on_entrance_motion(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        if old == new:
-            return
-        if new == "on":
-            self._cancel_timer()
-            self._turn_on_if_home("entrance")
-        elif new == "off":
-            self._start_off_timer_if_clear()
+    def on_entrance_motion_on(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        self._last_entrance_change = time.monotonic()
+        self.off_timer.cancel()
+        self._turn_on_if_home("entrance")
 
-    def on_kitchen_motion(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        if old == new:
-            return
-        if new == "on":
-            self._cancel_timer()
-            # Only trust kitchen sensor if entrance had recent motion
-            if self._had_recent_entrance_motion():
-                self._turn_on_if_home("kitchen")
-            else:
-                self.info("Kitchen motion ignored (no recent entrance motion)")
-        elif new == "off":
-            self._start_off_timer_if_clear()
+    def on_entrance_motion_off(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        self._last_entrance_change = time.monotonic()
+        self._start_off_timer_if_clear(entity, new)
+
+    def on_kitchen_motion_on(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        self.off_timer.cancel()
+        # Only trust kitchen sensor if entrance had recent motion
+        if self._had_recent_entrance_motion():
+            self._turn_on_if_home("kitchen")
+        else:
+            self.info("Kitchen motion ignored (no recent entrance motion)")
+
+    def on_kitchen_motion_off(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        self._start_off_timer_if_clear(entity, new)
 
     def _had_recent_entrance_motion(self) -> bool:
         """Check if entrance sensor is on or was recently on."""
         if self.get_state(self.ENTRANCE_MOTION) == "on":
             return True
-        # Check last_changed to see if it was recently active
+        # Changed recently (i.e. went off) - tracked by the entrance handlers
+        if self._last_entrance_change is None:
+            return False
+        return time.monotonic() - self._last_entrance_change < ENTRANCE_LOOKBACK_SECONDS
+
+    def _initial_entrance_change(self) -> float | None:
+        """Seed the last entrance change from last_changed at startup (restart safety)."""
         last_changed = self.get_state(self.ENTRANCE_MOTION, attribute="last_changed")
         if last_changed and isinstance(last_changed, str):
-            import datetime
             now = datetime.datetime.now(datetime.timezone.utc)
             changed = self.convert_utc(last_changed)
             seconds_ago = (now - changed).total_seconds()
-            return seconds_ago < ENTRANCE_LOOKBACK_SECONDS
-        return False
+            return time.monotonic() - seconds_ago
+        return None
 
     def _turn_on_if_home(self, source: str):
         """Turn on light if house is occupied."""
-        if self.get_state(self.HOUSE_OCCUPIED) != "on":
-            self.info(f"Motion from {source} but house not occupied")
+        if not self._occupied.value:
+            self.info("Motion from %s but house not occupied", source)
             return
 
         if self.get_state(self.LIGHT_SWITCH) == "off":
             self.motion_triggered_light = True
             self.call_service("switch/turn_on", entity_id=self.LIGHT_SWITCH)
-            self.info(f"Motion from {source}, light ON")
+            self.info("Motion from %s, light ON", source)
 
     # --- Off timer ---
 
-    def _start_off_timer_if_clear(self):
-        """Start off timer if both sensors are clear and not sticky."""
-        if self.get_state(self.STICKY_MODE) == "on":
+    def _start_off_timer_if_clear(self, known_entity: str, known_value: str):
+        """Start off timer if both sensors are clear and not sticky.
+
+        known_entity is the sensor that just changed to known_value, so only
+        the other sensor needs a state read.
+        """
+        if self._sticky_on.value:
             return
 
-        kitchen = self.get_state(self.KITCHEN_MOTION)
-        entrance = self.get_state(self.ENTRANCE_MOTION)
+        if known_entity == self.KITCHEN_MOTION:
+            other = self.ENTRANCE_MOTION
+        else:
+            other = self.KITCHEN_MOTION
 
-        if kitchen in ["off", "unavailable"] and entrance in ["off", "unavailable"]:
-            self._cancel_timer()
-            self.timer_handle = self.run_in(self._turn_off_light, self.OFF_DELAY)
-            self.info(f"All motion clear, {self.OFF_DELAY}s timer started")
+        if known_value in CLEAR_STATES and self.get_state(other) in CLEAR_STATES:
+            self.off_timer.start(self.OFF_DELAY)
+            self.info("All motion clear, %ss timer started", self.OFF_DELAY)
 
-    def _turn_off_light(self, kwargs):
+    def _turn_off_light(self):
         """Turn off light after timer expires."""
-        self.timer_handle = None
-
-        if self.get_state(self.STICKY_MODE) == "on":
+        if self._sticky_on.value:
             self.info("Timer expired but sticky mode ON")
             return
 
@@ -125,34 +146,24 @@ class KitchenMotionLight(BaseApp):
             self.call_service("switch/turn_off", entity_id=self.LIGHT_SWITCH)
             self.info("Timer expired, light OFF")
 
-    def _cancel_timer(self):
-        if self.timer_handle:
-            self.cancel_timer(self.timer_handle)
-            self.timer_handle = None
-
     # --- Sticky mode ---
 
     def on_light_change(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        if old == new:
-            return
-
         if new == "on" and not self.motion_triggered_light:
-            # Manual turn on → enable sticky
-            self.call_service("input_boolean/turn_on", entity_id=self.STICKY_MODE)
-            self.info("Manual light ON, sticky enabled")
+            # Manual turn on → enable sticky (skip the write if already on)
+            if not self._sticky_on.value:
+                self.call_service("input_boolean/turn_on", entity_id=self.STICKY_MODE)
+                self.info("Manual light ON, sticky enabled")
         elif new == "off":
-            # Any turn off → disable sticky
-            self.call_service("input_boolean/turn_off", entity_id=self.STICKY_MODE)
+            # Any turn off → disable sticky (skip the write if already off)
             self.motion_triggered_light = False
-            self.info("Light OFF, sticky disabled")
+            if self._sticky_on.value:
+                self.call_service("input_boolean/turn_off", entity_id=self.STICKY_MODE)
+                self.info("Light OFF, sticky disabled")
 
-    def on_sticky_change(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        if old == new:
-            return
-
-        if new == "on":
-            self._cancel_timer()
-            if self.get_state(self.LIGHT_SWITCH) == "off":
-                self.motion_triggered_light = True
-                self.call_service("switch/turn_on", entity_id=self.LIGHT_SWITCH)
-                self.info("Sticky ON, turning light ON")
+    def on_sticky_on(self, entity: str, attribute: str, old: str, new: str, **kwargs):
+        self.off_timer.cancel()
+        if self.get_state(self.LIGHT_SWITCH) == "off":
+            self.motion_triggered_light = True
+            self.call_service("switch/turn_on", entity_id=self.LIGHT_SWITCH)
+            self.info("Sticky ON, turning light ON")
@@ -1,6 +1,6 @@
 """Main room closet light automation."""
 
-from common import BaseApp
+from common import BaseApp, DeadlineTimer
 
 
 class ClosetMotionLight(BaseApp):
@@ -22,49 +22,33 @@ class ClosetMotionLight(BaseApp):
     OFF_DELAY_SECONDS = 90
 
     def initialize(self):
-        self.timer_handle = None
-        self.listen_state(self.on_motion_change, self.MOTION_SENSOR)
+        self.off_timer = DeadlineTimer(self, self._turn_off_light)
+        self._occupied = self.mirror_state(self.HOUSE_OCCUPIED)
+        self.listen_state(self.on_motion_detected, self.MOTION_SENSOR, new="on")
+        self.listen_state(self.on_motion_cleared, self.MOTION_SENSOR, new="off")
         self.info("Closet motion light initialized")
 
-    def on_motion_change(self, entity: str, attribute: str, old: str, new: str, **kwargs):
-        if old == new:
-            return
-
-        if new == "on":
-            self._on_motion_detected()
-        elif new == "off":
-            self._on_motion_cleared()
-
-    def _on_motion_detected(self):
+    def on_motion_detected(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Handle motion detected event."""
         # Cancel any pending off timer
-        self._cancel_timer()
+        self.off_timer.cancel()
 
         # Only turn on light if house is occupied
-        if self.get_state(self.HOUSE_OCCUPIED) == "on":
+        if self._occupied.value:
             self.call_service("switch/turn_on", entity_id=self.LIGHT_SWITCH)
             self.info("Motion detected, turning on closet light")
         else:
             self.info("Motion detected but house not occupied, ignoring")
 
-    def _on_motion_cleared(self):
+    def on_motion_cleared(self, entity: str, attribute: str, old: str, new: str, **kwargs):
         """Handle motion cleared event - start timer to turn off light."""
-        self._cancel_timer()
-        self.timer_handle = self.run_in(self._turn_off_light, self.OFF_DELAY_SECONDS)
-        self.info(f"Motion cleared, starting {self.OFF_DELAY_SECONDS}s timer")
+        self.off_timer.start(self.OFF_DELAY_SECONDS)
+        self.info("Motion cleared, starting %ss timer", self.OFF_DELAY_SECONDS)
 
-    def _turn_off_light(self, kwargs):
+    def _turn_off_light(self):
         """Turn off light if it's currently on."""
-        self.timer_handle = None
-
         if self.get_state(self.LIGHT_SWITCH) == "on":
             self.call_service("switch/turn_off", entity_id=self.LIGHT_SWITCH)
             self.info("Timer expired, turning off closet light")
         else:
             self.info("Timer expired but light already off")
-
-    def _cancel_timer(self):
-        """Cancel the pending off timer if active."""
-        if self.timer_handle is not None:
-            self.cancel_timer(self.timer_handle)
-            self.timer_handle = None
@@ -2,10 +2,14 @@
 
 Determines where to send notifications based on targets and device states.
 
-Each target has a `conditions` dict mapping tags to lambda functions.
+Each target is a NotifyDevice with a `conditions` dict mapping tags to
+conditions. A condition lists the entities it reads and a predicate over a
+snapshot of their states.
 When a notification is sent to a target (e.g., ["javier"]), the router:
-1. Finds all devices with matching tags
-2. For each device, evaluates the condition lambda for that tag
+1. Finds all devices with matching tags (via a tag index built at import),
+   merged into one entry per device
+2. Evaluates each device's conditions against a snapshot that reads each
+   entity's state on first use and reuses it for the rest of the call
 3. If any matching tag's condition passes, the device receives the notification
 
 This allows different conditions per tag. For example, a work laptop might:
@@ -13,80 +17,196 @@ This allows different conditions per tag. For example, a work laptop might:
 - Receive "home" notifications only when active AND user is home
 """
 
-from typing import Literal, Callable, Any
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Literal, Callable, Any, NamedTuple
 
 NotifyTarget = Literal["javier", "andy", "both", "home"]
 
 # Type for AppDaemon's get_state function
 GetStateFunc = Callable[..., Any]
 
-# Type for condition lambda
-ConditionFunc = Callable[[GetStateFunc], bool]
+# Entity states read during one resolve_targets call (entity_id -> state)
+StateSnapshot = dict[str, Any]
+
+# Resolves needing at least this many entities read all states in one call
+BULK_STATE_MIN_ENTITIES = 3
+
+
+class LazySnapshot(dict):
+    """State snapshot that reads each entity on first access, then memoizes it.
+
+    Scoped to a single resolve_targets call, so it is never stale.
+    """
+
+    __slots__ = ("_get_state",)
+
+    def __init__(self, get_state: GetStateFunc):
+        super().__init__()
+        self._get_state = get_state
+
+    def __missing__(self, entity_id: str) -> Any:
+        state = self[entity_id] = self._get_state(entity_id)
+        return state
+
+
+class Condition(NamedTuple):
+    """Entities a condition reads, and a predicate over their states."""
+
+    entities: frozenset[str]
+    check: Callable[[StateSnapshot], bool]
+
+
+@lru_cache(maxsize=None)
+def state_is(entity_id: str, state: str) -> Condition:
+    """Condition that passes while entity_id is in the given state.
+
+    Interned - every use of the same (entity_id, state) shares one Condition.
+    """
+    return Condition(frozenset({entity_id}), lambda snapshot: snapshot[entity_id] == state)
+
+
+def all_of(*conditions: Condition) -> Condition:
+    """Condition that passes when every given condition passes."""
+    checks = tuple(c.check for c in conditions)
+
+    def check(snapshot: StateSnapshot) -> bool:
+        # Plain loop over prebound checks - no generator per evaluation
+        for condition_check in checks:
+            if not condition_check(snapshot):
+                return False
+        return True
+
+    return Condition(frozenset().union(*(c.entities for c in conditions)), check)
+
+
+class NotifyDevice(NamedTuple):
+    """A notify service, the tags it answers to, and per-tag conditions.
+
+    A tag without a condition always notifies the device.
+    """
+
+    service: str
+    conditions: dict[str, Condition]
+    tags: frozenset[str]
+
+
+class ResolvePlan(NamedTuple):
+    """What resolving one combination of tags needs to check."""
+
+    # Every entity the conditions below can read
+    entities: frozenset[str]
+    # Each matching service once, with its distinct conditions
+    services: tuple[tuple[str, tuple[Condition | None, ...]], ...]
 
 
 class NotificationRouter:
     """Routes notifications to the right services based on conditions."""
 
-    TARGETS: list[dict[str, Any]] = [
+    __slots__ = ("get_state",)
+
+    TARGETS: tuple[NotifyDevice, ...] = (
         # Javier's phone - if home
-        {
-            "service": "mobile_app_javier_phone",
-            "conditions": {
-                "javier": lambda get_state: get_state("person.javier") == "home",
-                "both": lambda get_state: get_state("person.javier") == "home",
-                "home": lambda get_state: get_state("person.javier") == "home",
+        NotifyDevice(
+            service="mobile_app_javier_phone",
+            conditions={
+                "javier": state_is("person.javier", "home"),
+                "both": state_is("person.javier", "home"),
+                "home": state_is("person.javier", "home"),
             },
-            "tags": ["javier", "both", "home"],
-        },
+            tags=frozenset({"javier", "both", "home"}),
+        ),
         # Andy's phone - if home
-        {
-            "service": "mobile_app_andy_phone",
-            "conditions": {
-                "andy": lambda get_state: get_state("person.andy") == "home",
-                "both": lambda get_state: get_state("person.andy") == "home",
-                "home": lambda get_state: get_state("person.andy") == "home",
+        NotifyDevice(
+            service="mobile_app_andy_phone",
+            conditions={
+                "andy": state_is("person.andy", "home"),
+                "both": state_is("person.andy", "home"),
+                "home": state_is("person.andy", "home"),
             },
-            "tags": ["andy", "both", "home"],
-        },
+            tags=frozenset({"andy", "both", "home"}),
+        ),
         # Javier's tablet - if unlocked
-        {
-            "service": "mobile_app_javier_tablet",
-            "conditions": {
-                "javier": lambda get_state: get_state("binary_sensor.javier_tablet_device_locked") == "off",
-                "home": lambda get_state: get_state("binary_sensor.javier_tablet_device_locked") == "off",
+        NotifyDevice(
+            service="mobile_app_javier_tablet",
+            conditions={
+                "javier": state_is("binary_sensor.javier_tablet_device_locked", "off"),
+                "home": state_is("binary_sensor.javier_tablet_device_locked", "off"),
             },
-            "tags": ["javier", "home"],
-        },
+            tags=frozenset({"javier", "home"}),
+        ),
         # Andy's tablet - if interactive (screen on)
-        {
-            "service": "mobile_app_andy_tablet",
-            "conditions": {
-                "andy": lambda get_state: get_state("binary_sensor.andy_tablet_interactive") == "on",
-                "home": lambda get_state: get_state("binary_sensor.andy_tablet_interactive") == "on",
+        NotifyDevice(
+            service="mobile_app_andy_tablet",
+            conditions={
+                "andy": state_is("binary_sensor.andy_tablet_interactive", "on"),
+                "home": state_is("binary_sensor.andy_tablet_interactive", "on"),
             },
-            "tags": ["andy", "home"],
-        },
+            tags=frozenset({"andy", "home"}),
+        ),
         # Living room TV - if on
-        {
-            "service": "living_room_tv",
-            "conditions": {
-                "home": lambda get_state: get_state("media_player.living_room_tv") == "on",
+        NotifyDevice(
+            service="living_room_tv",
+            conditions={
+                "home": state_is("media_player.living_room_tv", "on"),
             },
-            "tags": ["home"],
-        },
+            tags=frozenset({"home"}),
+        ),
         # Javier's work laptop - active for javier, active+home for home
-        {
-            "service": "mobile_app_javier_work_laptop",
-            "conditions": {
-                "javier": lambda get_state: get_state("binary_sensor.javier_work_laptop_active") == "on",
-                "home": lambda get_state: (
-                    get_state("binary_sensor.javier_work_laptop_active") == "on"
-                    and get_state("person.javier") == "home"
+        NotifyDevice(
+            service="mobile_app_javier_work_laptop",
+            conditions={
+                "javier": state_is("binary_sensor.javier_work_laptop_active", "on"),
+                "home": all_of(
+                    state_is("binary_sensor.javier_work_laptop_active", "on"),
+                    state_is("person.javier", "home"),
                 ),
             },
-            "tags": ["javier", "home"],
-        },
-    ]
+            tags=frozenset({"javier", "home"}),
+        ),
+    )
+
+    # tag -> [(service, condition)] in TARGETS order, built by _build_index()
+    _TAG_INDEX: dict[str, list[tuple[str, Condition | None]]] = {}
+
+    # frozenset of requested tags -> ResolvePlan, see _plan()
+    _PLANS: dict[frozenset[str], ResolvePlan] = {}
+
+    @classmethod
+    def _build_index(cls):
+        """Index TARGETS by tag so resolving only visits requested tags."""
+        cls._TAG_INDEX = {}
+        cls._PLANS = {}
+        for device in cls.TARGETS:
+            for tag in device.tags:
+                cls._TAG_INDEX.setdefault(tag, []).append(
+                    (device.service, device.conditions.get(tag))
+                )
+
+    @classmethod
+    def _plan(cls, tags: frozenset[str]) -> ResolvePlan:
+        """Each service matching these tags once, with all its distinct conditions.
+
+        Built on first use per tag combination (there are only a handful).
+        """
+        plan = cls._PLANS.get(tags)
+        if plan is None:
+            merged: dict[str, list[Condition | None]] = {}
+            for tag in tags:
+                for service, condition in cls._TAG_INDEX.get(tag, ()):
+                    conditions = merged.setdefault(service, [])
+                    if condition not in conditions:
+                        conditions.append(condition)
+            services = tuple(
+                # A tag without a condition always notifies - nothing to check
+                (service, (None,) if None in conditions else tuple(conditions))
+                for service, conditions in merged.items()
+            )
+            entities = frozenset().union(
+                *(c.entities for _, conditions in services for c in conditions if c is not None)
+            )
+            plan = cls._PLANS[tags] = ResolvePlan(entities, services)
+        return plan
 
     def __init__(self, get_state: GetStateFunc):
         """Initialize with a state getter function.
@@ -96,35 +216,37 @@ class NotificationRouter:
         """
         self.get_state = get_state
 
-    def resolve_targets(self, targets: list[NotifyTarget]) -> set[str]:
+    def resolve_targets(self, targets: Iterable[NotifyTarget]) -> set[str]:
         """Resolve target names to actual notify services based on conditions.
 
         Args:
-            targets: List of targets like ["javier", "home", "both"]
+            targets: Targets like ["javier", "home", "both"] (list or set)
 
         Returns:
             Set of notify service names to call
         """
         services: set[str] = set()
 
-        for target_def in self.TARGETS:
-            # Find matching tags
-            matching_tags = [tag for tag in target_def["tags"] if tag in targets]
-            if not matching_tags:
-                continue
+        plan = self._plan(frozenset(targets))
 
-            # Check if any matching tag's condition passes (OR logic)
-            conditions = target_def.get("conditions", {})
-            should_notify = False
+        # Entities are read on first use only - a device whose condition
+        # already passed never reads the ones its other conditions would need
+        snapshot = LazySnapshot(self.get_state)
 
-            for tag in matching_tags:
-                condition = conditions.get(tag)
-                # If no condition for this tag, or condition passes -> notify
-                if condition is None or condition(self.get_state):
-                    should_notify = True
-                    break
+        if len(plan.entities) >= BULK_STATE_MIN_ENTITIES:
+            # One read of the whole namespace is cheaper than several single
+            # reads (copy=False: we only look at it, never keep or modify it)
+            states = self.get_state(copy=False) or {}
+            for entity_id in plan.entities:
+                snapshot[entity_id] = (states.get(entity_id) or {}).get("state")
 
-            if should_notify:
-                services.add(target_def["service"])
+        for service, conditions in plan.services:
+            # Stop at the first passing condition (OR logic)
+            # If no condition for this tag, or condition passes -> notify
+            if any(condition is None or condition.check(snapshot) for condition in conditions):
+                services.add(service)
 
         return services
+
+
+NotificationRouter._build_index()